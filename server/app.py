@@ -7,30 +7,121 @@ OpenVisus servers, enabling the frontend to retrieve data for visualization.
 
 import sys
 import os
+import re
 import argparse
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
 
 # Add scripts directory to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
 
-from flask import Flask, jsonify, request, send_from_directory
+import orjson
+from flask import Flask, Response, jsonify, request, send_file
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
 from server.data_service import DataService
 
+
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson.
+
+    Serializes NumPy arrays and scalars natively in C, so response
+    building skips both the .tolist() materialization and the stdlib
+    per-float formatting loop.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for frontend access
 
 # Initialize data service
 data_service = DataService()
 
+# Warm the process-global dataset/coordinate caches at startup so the first
+# user request doesn't pay the connection + metadata round trip. A failure
+# (e.g. server temporarily unreachable) must not stop the server from
+# starting; affected fields will simply load lazily on first use.
+try:
+    data_service.warmup()
+except Exception as e:
+    print(f"Warning: dataset warmup failed at startup: {e}")
+
+
+@dataclass(frozen=True)
+class SliceQuery:
+    """Query parameters shared by the data endpoints, parsed once per request."""
+    field: str
+    timestep: int
+    quality: int
+    format_type: str
+    lat_range: Tuple[float, float]
+    lon_range: Tuple[float, float]
+
+
+def parse_slice_args(args):
+    """
+    Parse the query parameters common to the data endpoints.
+
+    Parameters:
+    -----------
+    args : werkzeug MultiDict
+        request.args for the current request
+
+    Returns:
+    --------
+    SliceQuery : parsed parameters
+
+    Raises ValueError/TypeError on missing or malformed parameters, which
+    the handlers translate into HTTP 400.
+    """
+    return SliceQuery(
+        field=args.get("field", "salinity"),
+        timestep=int(args.get("timestep", 0)),
+        quality=int(args.get("quality", -12)),
+        format_type=args.get("format", "base64"),
+        lat_range=(float(args.get("lat_min")), float(args.get("lat_max"))),
+        lon_range=(float(args.get("lon_min")), float(args.get("lon_max"))),
+    )
+
+
+def binary_response(payload, shape):
+    """
+    Build an application/octet-stream response for raw float32 data.
+
+    The shape and dtype travel in headers so the frontend can wrap the
+    body in a Float32Array without any JSON or base64 decoding.
+    """
+    resp = Response(payload, mimetype="application/octet-stream")
+    resp.headers["X-Shape"] = ",".join(map(str, shape))
+    resp.headers["X-Dtype"] = "float32"
+    # Let browser JavaScript read the custom headers under CORS
+    resp.headers["Access-Control-Expose-Headers"] = "X-Shape, X-Dtype"
+    return resp
+
 
 @app.route("/api/health", methods=["GET"])
 def health_check():
-    """Health check endpoint."""
-    return jsonify({"status": "healthy", "service": "LLC4320 Data API"})
+    """Health check endpoint. Includes cache statistics."""
+    return jsonify({
+        "status": "healthy",
+        "service": "LLC4320 Data API",
+        "read_cache": data_service.read_cache_stats(),
+        "response_cache": data_service.response_cache_stats()
+    })
 
 
 @app.route("/api/metadata", methods=["GET"])
@@ -68,40 +159,72 @@ def get_data_slice():
         lon_min (float): Minimum longitude in degrees (required)
         lon_max (float): Maximum longitude in degrees (required)
         quality (int): Data quality level, -12 to 0 (default: -12)
-        format (str): Response format - 'array' or 'base64' (default: 'array')
+        format (str): Response format - 'base64', 'base64_blosc', 'base64_fp16', 'array' or 'binary' (default: 'base64')
     
     Returns:
         JSON with data array and coordinates for the slice.
     """
     try:
         # Parse query parameters
-        field = request.args.get("field", "salinity")
-        timestep = int(request.args.get("timestep", 0))
+        query = parse_slice_args(request.args)
         depth_level = int(request.args.get("depth_level", 0))
-        quality = int(request.args.get("quality", -12))
-        format_type = request.args.get("format", "array")
-        
-        # Parse lat/lon ranges (required)
-        lat_min = float(request.args.get("lat_min"))
-        lat_max = float(request.args.get("lat_max"))
-        lon_min = float(request.args.get("lon_min"))
-        lon_max = float(request.args.get("lon_max"))
-        
-        lat_range = [lat_min, lat_max]
-        lon_range = [lon_min, lon_max]
-        
+
+        # Raw binary response: float32 bytes, shape/dtype in headers
+        if query.format_type == "binary":
+            payload, shape = data_service.get_data_slice_binary(
+                field=query.field,
+                timestep=query.timestep,
+                depth_level=depth_level,
+                lat_range=query.lat_range,
+                lon_range=query.lon_range,
+                quality=query.quality
+            )
+            return binary_response(payload, shape)
+
         # Get data slice
         result = data_service.get_data_slice(
-            field=field,
-            timestep=timestep,
+            field=query.field,
+            timestep=query.timestep,
+            depth_level=depth_level,
+            lat_range=query.lat_range,
+            lon_range=query.lon_range,
+            quality=query.quality,
+            format_type=query.format_type
+        )
+
+        return jsonify(result.as_dict())
+    except (ValueError, TypeError) as e:
+        return jsonify({"error": f"Invalid parameter: {str(e)}"}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/data/slice/binary", methods=["GET"])
+def get_data_slice_packed():
+    """
+    Get a 2D slice plus coordinates as one self-describing binary payload.
+
+    Unlike /api/data/slice with format=binary (data only, shape in HTTP
+    headers), the response body here starts with a small struct header
+    followed by contiguous float32 blocks for data, latitude and longitude
+    - one request, no JSON or base64 anywhere. See the server README for
+    the layout and a JavaScript decoding example.
+
+    Query parameters: same as /api/data/slice (format is ignored).
+    """
+    try:
+        query = parse_slice_args(request.args)
+        depth_level = int(request.args.get("depth_level", 0))
+
+        payload = data_service.get_data_slice_packed(
+            field=query.field,
+            timestep=query.timestep,
             depth_level=depth_level,
-            lat_range=lat_range,
-            lon_range=lon_range,
-            quality=quality,
-            format_type=format_type
+            lat_range=query.lat_range,
+            lon_range=query.lon_range,
+            quality=query.quality
         )
-        
-        return jsonify(result)
+        return Response(payload, mimetype="application/octet-stream")
     except (ValueError, TypeError) as e:
         return jsonify({"error": f"Invalid parameter: {str(e)}"}), 400
     except Exception as e:
@@ -123,41 +246,90 @@ def get_timestep_data():
         z_min (int): Minimum depth level index (default: 0)
         z_max (int): Maximum depth level index (default: 1)
         quality (int): Data quality level, -12 to 0 (default: -12)
-        format (str): Response format - 'array' or 'base64' (default: 'array')
+        format (str): Response format - 'base64', 'base64_blosc', 'base64_fp16', 'array' or 'binary' (default: 'base64')
     
     Returns:
         JSON with 3D data array (depth, y, x) and coordinates.
     """
     try:
         # Parse query parameters
-        field = request.args.get("field", "salinity")
-        timestep = int(request.args.get("timestep", 0))
+        query = parse_slice_args(request.args)
         z_min = int(request.args.get("z_min", 0))
         z_max = int(request.args.get("z_max", 1))
-        quality = int(request.args.get("quality", -12))
-        format_type = request.args.get("format", "array")
-        
-        # Parse lat/lon ranges (required)
-        lat_min = float(request.args.get("lat_min"))
-        lat_max = float(request.args.get("lat_max"))
-        lon_min = float(request.args.get("lon_min"))
-        lon_max = float(request.args.get("lon_max"))
-        
-        lat_range = [lat_min, lat_max]
-        lon_range = [lon_min, lon_max]
         z_range = [z_min, z_max]
-        
+
+        # Raw binary response: float32 bytes, shape/dtype in headers
+        if query.format_type == "binary":
+            payload, shape = data_service.get_timestep_data_binary(
+                field=query.field,
+                timestep=query.timestep,
+                lat_range=query.lat_range,
+                lon_range=query.lon_range,
+                z_range=z_range,
+                quality=query.quality
+            )
+            return binary_response(payload, shape)
+
         result = data_service.get_timestep_data(
-            field=field,
-            timestep=timestep,
-            lat_range=lat_range,
-            lon_range=lon_range,
+            field=query.field,
+            timestep=query.timestep,
+            lat_range=query.lat_range,
+            lon_range=query.lon_range,
             z_range=z_range,
-            quality=quality,
-            format_type=format_type
+            quality=query.quality,
+            format_type=query.format_type
+        )
+
+        return jsonify(result.as_dict())
+    except (ValueError, TypeError) as e:
+        return jsonify({"error": f"Invalid parameter: {str(e)}"}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/data/timesteps", methods=["GET"])
+def get_timesteps_data():
+    """
+    Get data for multiple timesteps in one request (4D data: time, depth, y, x).
+
+    The per-timestep OpenVisus reads run concurrently on the server, so
+    fetching N timesteps here is much faster than N /api/data/timestep calls.
+
+    Query parameters:
+        field (str): Field name - 'salinity', 'temperature', 'vertical_velocity', etc. (default: 'salinity')
+        timesteps (str): Comma-separated timestep indices, e.g. '0,1,2' (required)
+        lat_min (float): Minimum latitude in degrees (required)
+        lat_max (float): Maximum latitude in degrees (required)
+        lon_min (float): Minimum longitude in degrees (required)
+        lon_max (float): Maximum longitude in degrees (required)
+        z_min (int): Minimum depth level index (default: 0)
+        z_max (int): Maximum depth level index (default: 1)
+        quality (int): Data quality level, -12 to 0 (default: -12)
+        format (str): Response format - 'base64' or 'array' (default: 'base64')
+
+    Returns:
+        JSON with 4D data array (time, depth, y, x) and coordinates.
+    """
+    try:
+        query = parse_slice_args(request.args)
+        timesteps_arg = request.args.get("timesteps")
+        if not timesteps_arg:
+            raise ValueError("'timesteps' is required (comma-separated indices)")
+        timesteps = [int(t) for t in timesteps_arg.split(",")]
+        z_min = int(request.args.get("z_min", 0))
+        z_max = int(request.args.get("z_max", 1))
+
+        result = data_service.get_timesteps_data(
+            field=query.field,
+            timesteps=timesteps,
+            lat_range=query.lat_range,
+            lon_range=query.lon_range,
+            z_range=[z_min, z_max],
+            quality=query.quality,
+            format_type=query.format_type
         )
-        
-        return jsonify(result)
+
+        return jsonify(result.as_dict())
     except (ValueError, TypeError) as e:
         return jsonify({"error": f"Invalid parameter: {str(e)}"}), 400
     except Exception as e:
@@ -176,18 +348,68 @@ def internal_error(error):
     return jsonify({"error": "Internal server error"}), 500
 
 
+FRONTEND_DIR = (PROJECT_ROOT / "frontend").resolve()
+
+# Fingerprinted asset names (e.g. app.3f9c2d1e.js) change whenever their
+# content does, so browsers may cache them forever
+_FINGERPRINT_RE = re.compile(r"\.[0-9a-f]{8,}\.")
+
+
+# Successful resolutions of fingerprinted names. Only those may be
+# cached: their content-addressed names never point at changed files,
+# while caching mutable names (or misses) would 404 assets deployed
+# after startup and keep "resolving" deleted ones.
+_FINGERPRINT_RESOLUTIONS = {}
+_FINGERPRINT_RESOLUTIONS_MAX = 256
+
+
+def _resolve_frontend_path(path: str):
+    """
+    Resolve a request path to a file inside the frontend directory.
+
+    Returns None for paths that escape the frontend directory or do not
+    exist (the handler turns that into a 404).
+    """
+    resolved = (FRONTEND_DIR / path).resolve()
+    if FRONTEND_DIR not in resolved.parents and resolved != FRONTEND_DIR:
+        return None
+    if not resolved.is_file():
+        return None
+    return resolved
+
+
+def _send_frontend_file(path: str):
+    """Serve a frontend file with caching headers appropriate to its name."""
+    resolved = _FINGERPRINT_RESOLUTIONS.get(path)
+    if resolved is None:
+        resolved = _resolve_frontend_path(path)
+        if (resolved is not None
+                and _FINGERPRINT_RE.search(resolved.name)
+                and len(_FINGERPRINT_RESOLUTIONS) < _FINGERPRINT_RESOLUTIONS_MAX):
+            _FINGERPRINT_RESOLUTIONS[path] = resolved
+    if resolved is None:
+        return jsonify({"error": "Endpoint not found"}), 404
+
+    if _FINGERPRINT_RE.search(resolved.name):
+        # Content-addressed assets: cache forever, no revalidation
+        resp = send_file(resolved, max_age=31536000)
+        resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    else:
+        # Mutable files (index.html etc.): revalidate via ETag/304
+        resp = send_file(resolved, conditional=True, max_age=0)
+    return resp
+
+
 @app.route("/", methods=["GET"])
 def serve_frontend():
     """Serve the frontend test page."""
-    frontend_dir = PROJECT_ROOT / "frontend"
-    return send_from_directory(str(frontend_dir), "index.html")
+    return _send_frontend_file("index.html")
 
 
 @app.route("/<path:path>", methods=["GET"])
 def serve_static(path):
     """Serve static files from frontend directory."""
-    frontend_dir = PROJECT_ROOT / "frontend"
-    return send_from_directory(str(frontend_dir), path)
+    return _send_frontend_file(path)
 
 
 if __name__ == "__main__":
@@ -7,12 +7,40 @@ and serialization for the Flask API.
 
 import numpy as np
 import xarray as xr
-import openvisuspy as ovp
+import logging
+import threading
+from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-import base64
+import hashlib
 import os
+import struct
 from typing import Dict, Any, Optional, Tuple
 
+try:
+    # SIMD-accelerated base64; ~5-10x faster than stdlib on large blobs
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+try:
+    import diskcache
+except ImportError:  # persistent slice cache is optional
+    diskcache = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; numpy reductions remain the fallback
+    njit = None
+
+try:
+    from numcodecs import Blosc
+    _BLOSC = Blosc(cname="zstd", clevel=3, shuffle=Blosc.SHUFFLE)
+except ImportError:  # numcodecs is optional for the server
+    _BLOSC = None
+
 # Field URLs for OpenVisus access
 FIELD_URLS = {
     "salinity": "https://nsdf-climate1-origin.nationalresearchplatform.org:50098/nasa/nsdf/climate1/llc4320/idx/salt/salt_llc4320_x_y_depth.idx",
@@ -23,6 +51,383 @@ FIELD_URLS = {
     "w": "https://nsdf-climate1-origin.nationalresearchplatform.org:50098/nasa/nsdf/climate1/llc4320/idx/w/w_llc4320_x_y_depth.idx",
 }
 
+# Derived field lookups, built once; per-request validation and metadata
+# responses reuse these instead of rebuilding lists/dicts
+_FIELD_KEYS = frozenset(FIELD_URLS)
+_AVAILABLE_FIELDS = tuple(FIELD_URLS.keys())
+_FIELD_UNITS = {
+    "salinity": "g kg⁻¹",
+    "salt": "g kg⁻¹",
+    "temperature": "°C",
+    "theta": "°C",
+    "vertical_velocity": "m s⁻¹",
+    "w": "m s⁻¹"
+}
+
+# IDX block edge length. Reads are snapped outward to multiples of this so
+# nearby queries request identical blocks and hit the OpenVisus HTTP cache
+# instead of forcing the server to trim fresh multi-chunk regions.
+IDX_BLOCK = 256
+
+# Byte budget for the in-memory cache of raw OpenVisus read results
+READ_CACHE_MAX_BYTES = 512 * 2**20  # 512 MiB
+
+# Byte budget for the cache of fully serialized responses
+RESPONSE_CACHE_MAX_BYTES = 256 * 2**20  # 256 MiB
+
+# Disk budget for the persistent cache of post-processed read results
+SLICE_CACHE_SIZE_LIMIT = 10 * 2**30  # 10 GiB
+
+# Upper bound on tracked (bbox, timestep) depth-scrub histories; the
+# oldest entry is dropped past this so the dict cannot grow for the
+# lifetime of the service
+DEPTH_HISTORY_MAX = 256
+
+# Process-global caches shared by all DataService instances. A service may
+# be instantiated per worker thread/request; keeping dataset handles (keyed
+# by URL) and coordinate arrays (keyed by file path) at module scope means
+# the ovp.LoadDataset handshake and the NetCDF read happen once per process.
+# Under gunicorn, run with --preload so forked workers inherit a warm cache.
+_GLOBAL_LOCK = threading.RLock()
+_GLOBAL_DS_FUTURES: Dict[str, Future] = {}
+_GLOBAL_COORDS: Dict[str, Tuple] = {}
+
+logger = logging.getLogger(__name__)
+
+if njit is not None:
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _bbox_kernel(lat, lon, lat_min, lat_max, lon_min, lon_max):
+        """
+        Fused parallel bounding-box scan over a curvilinear grid.
+
+        One pass over both 2-D coordinate arrays at memory bandwidth,
+        instead of the numpy version's mask + per-axis reduction
+        temporaries. The prange loop only writes its row's first/last hit
+        into per-row output arrays (numba's parfor pass cannot reduce
+        scalars that are themselves loop-carried inside the body); the
+        cheap O(h) reduction over rows runs serially afterwards. Returns
+        inclusive (y_lo, y_hi, x_lo, x_hi), with y_hi == -1 when nothing
+        falls inside the range.
+        """
+        h, w = lat.shape
+        row_lo = np.full(h, w, dtype=np.int64)
+        row_hi = np.full(h, -1, dtype=np.int64)
+        for i in prange(h):
+            lo, hi = w, -1
+            for j in range(w):
+                if (lat_min <= lat[i, j] <= lat_max
+                        and lon_min <= lon[i, j] <= lon_max):
+                    if j < lo:
+                        lo = j
+                    hi = j
+            row_lo[i] = lo
+            row_hi[i] = hi
+        y_lo, y_hi = h, -1
+        x_lo, x_hi = w, -1
+        for i in range(h):
+            if row_hi[i] >= 0:
+                if i < y_lo:
+                    y_lo = i
+                y_hi = i
+                if row_lo[i] < x_lo:
+                    x_lo = row_lo[i]
+                if row_hi[i] > x_hi:
+                    x_hi = row_hi[i]
+        return y_lo, y_hi, x_lo, x_hi
+else:
+    _bbox_kernel = None
+
+# openvisuspy drags in the OpenVisus C++ module, whose dlopen costs several
+# hundred ms; imported on first dataset load so worker forks start fast
+_ovp_mod = None
+
+
+def _ovp():
+    """Import openvisuspy lazily and return the module."""
+    global _ovp_mod
+    if _ovp_mod is None:
+        import openvisuspy
+        _ovp_mod = openvisuspy
+    return _ovp_mod
+
+
+def _serialize_b64(
+    arr: np.ndarray, compress: bool = False, dtype=np.float32
+) -> Dict[str, Any]:
+    """
+    Serialize an array as base64-encoded little-endian float bytes.
+
+    A memoryview over the array buffer + base64 encode is memory-bound and
+    copy-free, unlike the array format which builds a Python object per
+    element. Used for both data and coordinate arrays in base64-format
+    responses.
+
+    Parameters:
+    -----------
+    arr : np.ndarray
+        Array to serialize
+    compress : bool
+        Blosc-zstd compress the bytes before base64 encoding (the
+        'base64_blosc' response format). Requires numcodecs.
+    dtype : numpy dtype
+        Wire dtype; np.float16 halves the payload (the 'base64_fp16'
+        response format) since these fields don't carry 24 bits of
+        visually meaningful mantissa. Default float32.
+    """
+    # Skip the conversion copy when the array already matches
+    if arr.dtype == dtype and arr.flags["C_CONTIGUOUS"]:
+        arr32 = arr
+    else:
+        arr32 = np.ascontiguousarray(arr, dtype=dtype)
+
+    if compress:
+        if _BLOSC is None:
+            raise ValueError(
+                "format 'base64_blosc' requires the numcodecs package"
+            )
+        payload = _BLOSC.encode(arr32)
+        fmt = "base64_blosc"
+    else:
+        # b64encode reads straight from the array buffer - no tobytes() copy
+        payload = memoryview(arr32).cast("B")
+        fmt = "base64"
+
+    return {
+        "format": fmt,
+        "dtype": np.dtype(dtype).name,
+        "shape": list(arr32.shape),
+        "data": _b64.b64encode(payload).decode('ascii')
+    }
+
+
+# The compressed format was first shipped as 'base64+blosc', but '+' in a
+# query string decodes to a space, so requests using the documented token
+# silently fell through to plain base64. The canonical token is now
+# underscore-style (matching 'base64_fp16'); the old spelling and its
+# space-decoded form stay accepted as aliases.
+_FORMAT_ALIASES = {
+    "base64+blosc": "base64_blosc",
+    "base64 blosc": "base64_blosc",
+}
+
+
+def _canonical_format(format_type: str) -> str:
+    """Map legacy format spellings onto their canonical token."""
+    return _FORMAT_ALIASES.get(format_type, format_type)
+
+
+def _coordinates_payload(
+    lat: np.ndarray, lon: np.ndarray, serialize: bool
+) -> Dict[str, Any]:
+    """
+    Build the coordinates part of a response.
+
+    On separable grids the extraction path hands over two 1-D axis crops;
+    sending those (H + W floats, flagged 'separable') instead of the tiled
+    H x W arrays shrinks the coordinate payload by orders of magnitude and
+    the client reconstructs the grid by broadcasting.
+
+    Parameters:
+    -----------
+    lat, lon : np.ndarray
+        1-D axis crops (separable grid) or 2-D coordinate crops
+    serialize : bool
+        Base64-encode the arrays (False for the legacy array format,
+        where orjson serializes the ndarrays natively)
+    """
+    if lat.ndim == 1:
+        if serialize:
+            return {
+                "separable": True,
+                "latitude_1d": _serialize_b64(lat),
+                "longitude_1d": _serialize_b64(lon)
+            }
+        return {
+            "separable": True,
+            "latitude_1d": np.ascontiguousarray(lat),
+            "longitude_1d": np.ascontiguousarray(lon)
+        }
+    if serialize:
+        return {
+            "latitude": _serialize_b64(lat),
+            "longitude": _serialize_b64(lon)
+        }
+    # orjson refuses non-contiguous arrays, and the coordinate crops are
+    # views; ascontiguousarray is a no-op when they already qualify
+    return {
+        "latitude": np.ascontiguousarray(lat),
+        "longitude": np.ascontiguousarray(lon)
+    }
+
+
+# Magic and version for the packed binary response layout (see _pack_blocks)
+_PACK_MAGIC = b"LLCB"
+_PACK_VERSION = 1
+
+
+def _pack_blocks(data: np.ndarray, lat: np.ndarray, lon: np.ndarray) -> bytes:
+    """
+    Pack data + coordinates into one binary payload with a small header.
+
+    Layout (all little-endian, offsets relative to payload start):
+        magic 'LLCB' (4s) | version (H) | data ndim (H)
+        | data shape (ndim * I) | lat shape (2 * I) | lon shape (2 * I)
+        | data offset (Q) | lat offset (Q) | lon offset (Q)
+        | padding to 8 bytes | float32 blocks: data, lat, lon
+
+    The client reads the header once, then wraps each block in a
+    Float32Array over the same ArrayBuffer - no JSON, no base64, no copy.
+    """
+    blocks = [np.ascontiguousarray(a, dtype="<f4") for a in (data, lat, lon)]
+    head_fmt = "<4sHH" + "I" * blocks[0].ndim + "IIII" + "QQQ"
+    head_size = struct.calcsize(head_fmt)
+    # Align the first block to 8 bytes so Float32Array views are valid
+    pad = (-head_size) % 8
+    offsets = []
+    pos = head_size + pad
+    for block in blocks:
+        offsets.append(pos)
+        pos += block.nbytes
+    header = struct.pack(
+        head_fmt,
+        _PACK_MAGIC, _PACK_VERSION, blocks[0].ndim,
+        *blocks[0].shape,
+        *blocks[1].shape, *blocks[2].shape,
+        *offsets
+    )
+    return b"".join([header, b"\x00" * pad] + [b.tobytes() for b in blocks])
+
+
+class _ResponseBase:
+    """
+    Shared behavior for the slot-based response dataclasses.
+
+    as_dict builds a shallow dict for jsonify; dataclasses.asdict is
+    avoided because its deepcopy would duplicate the (possibly large)
+    payload containers on every request.
+    """
+
+    __slots__ = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@dataclass(slots=True)
+class SliceResponse(_ResponseBase):
+    """2D slice response: one timestep, one depth level."""
+    field: str
+    timestep: int
+    depth_level: int
+    data: Any
+    coordinates: Dict[str, Any]
+    shape: list
+    lat_range: list
+    lon_range: list
+    quality: int
+
+
+@dataclass(slots=True)
+class TimestepResponse(_ResponseBase):
+    """3D response: one timestep across a depth range."""
+    field: str
+    timestep: int
+    data: Any
+    coordinates: Dict[str, Any]
+    shape: list
+    lat_range: list
+    lon_range: list
+    z_range: list
+    quality: int
+
+
+@dataclass(slots=True)
+class TimestepsResponse(_ResponseBase):
+    """4D response: multiple timesteps across a depth range."""
+    field: str
+    timesteps: list
+    data: Any
+    coordinates: Dict[str, Any]
+    shape: list
+    lat_range: list
+    lon_range: list
+    z_range: list
+    quality: int
+
+
+def _response_nbytes(resp) -> int:
+    """
+    Approximate size of a serialized response.
+
+    Dominated by the data and coordinate payloads, which are either
+    base64 strings or (in the legacy array format) raw ndarrays.
+    """
+    total = 0
+    for part in (resp.data, *resp.coordinates.values()):
+        if isinstance(part, dict):
+            payload = part["data"]
+        elif isinstance(part, np.ndarray):
+            payload = part
+        else:
+            continue  # e.g. the 'separable' flag
+        total += len(payload) if isinstance(payload, str) else payload.nbytes
+    return total
+
+
+class _ArrayLRU:
+    """
+    Byte-bounded LRU cache for ndarray read results.
+
+    Eviction is by total bytes rather than entry count, so a few large
+    slices cannot blow past the memory budget. Thread-safe, since Flask
+    may serve requests from multiple threads. Entries are sized by
+    ndarray nbytes unless a custom sizeof callable is given.
+    """
+
+    def __init__(self, max_bytes: int, sizeof=None):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._sizeof = sizeof if sizeof is not None else (lambda v: v.nbytes)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached array for key, or None on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Insert an entry, evicting least-recently-used entries if needed."""
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._entries.pop(key)
+                self._total_bytes -= self._sizes.pop(key)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(evicted_key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for monitoring (entries, bytes, hit rate)."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
 
 class DataService:
     """
@@ -32,7 +437,43 @@ class DataService:
     for retrieving data slices in various formats. Dataset objects are cached
     for performance.
     """
-    
+
+    # The executors are created lazily per process, keyed by pid. Under
+    # gunicorn --preload (the deployment the README recommends) the
+    # synchronous warmup in the master starts pool threads before the
+    # fork; a forked worker would inherit executors whose threads are
+    # dead but still counted, so ThreadPoolExecutor never spawns
+    # replacements and any post-fork submit queues forever.
+    _pools_lock = threading.Lock()
+    _pools_pid: Optional[int] = None
+    _io_pool: Optional[ThreadPoolExecutor] = None
+    _load_pool: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def _executors(cls) -> Tuple[ThreadPoolExecutor, ThreadPoolExecutor]:
+        """
+        This process's (read pool, loader pool) pair, created on first use.
+
+        The read pool fans OpenVisus reads out across timesteps - they
+        are HTTP-bound and release the GIL, so threads overlap the
+        network latency. The loader pool runs ovp.LoadDataset handshakes
+        separately: reads block in _get_dataset() waiting for the load
+        future, and if the load itself queued on the read pool, a
+        request with >= 8 timesteps for a not-yet-loaded field would
+        fill every worker with tasks waiting on a load that can never
+        be scheduled.
+        """
+        pid = os.getpid()
+        if cls._pools_pid != pid:
+            with cls._pools_lock:
+                if cls._pools_pid != pid:
+                    cls._io_pool = ThreadPoolExecutor(max_workers=8)
+                    cls._load_pool = ThreadPoolExecutor(max_workers=4)
+                    # Set last: a reader that sees the matching pid is
+                    # guaranteed to see the fresh pools
+                    cls._pools_pid = pid
+        return cls._io_pool, cls._load_pool
+
     def __init__(self, data_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize the data service.
@@ -52,7 +493,7 @@ class DataService:
         
         # Coordinate file path
         self.latlon_file = self.data_dir / "llc4320_latlon.nc"
-        print(f"PATH to llc4320_latlon.nc file: {self.latlon_file}")
+        logger.info("PATH to llc4320_latlon.nc file: %s", self.latlon_file)
         
         # Set up OpenVisus cache
         if cache_dir is None:
@@ -60,67 +501,371 @@ class DataService:
         os.environ["VISUS_CACHE"] = str(cache_dir)
         cache_dir.mkdir(exist_ok=True)
         
-        # Cache for loaded datasets (field_name -> dataset object)
-        self._datasets = {}
-        
-        # Cache for coordinates (loaded once)
-        self._lat_center = None
-        self._lon_center = None
+        # Per-instance references into the process-global coordinate cache
+        # (filled on first use by _load_coordinates)
+        self._coords = None
+        self._lat_1d = None
+        self._lon_1d = None
+        self._is_separable = False
+
+        # In-memory LRU for raw OpenVisus read results, so repeat slice
+        # queries (panning/scrubbing in the UI) skip the network entirely
+        self._read_cache = _ArrayLRU(READ_CACHE_MAX_BYTES)
+
+        # LRU for fully serialized responses: a repeat of an identical
+        # query returns the cached dict directly, skipping the read,
+        # the coordinate crop and the serialization
+        self._response_cache = _ArrayLRU(
+            RESPONSE_CACHE_MAX_BYTES, sizeof=_response_nbytes
+        )
+
+        # Persistent cache of post-processed slices (bbox-cropped float32
+        # bytes), so repeat queries across process restarts - the dashboard
+        # "front page" view above all - are disk-bound instead of
+        # network-bound. OpenVisus' own cache still holds raw blocks.
+        if diskcache is not None:
+            self._slice_cache = diskcache.Cache(
+                str(cache_dir / "slice_cache"), size_limit=SLICE_CACHE_SIZE_LIMIT
+            )
+        else:
+            self._slice_cache = None
+
+        # Depth levels requested per (field, timestep, bbox, quality) view;
+        # drives the switch to whole-cube reads when a client scrubs depths
+        self._depth_history: Dict[tuple, set] = {}
+
+        # Start warming the dataset handles in the background immediately;
+        # by the time the first request needs a field, its handshake has
+        # usually already finished (or is in flight and just awaited)
+        threading.Thread(
+            target=self.warmup, name="dataservice-warmup", daemon=True
+        ).start()
+
+    def read_cache_stats(self) -> Dict[str, Any]:
+        """Statistics of the in-memory read cache, for the health endpoint."""
+        return self._read_cache.stats()
+
+    def response_cache_stats(self) -> Dict[str, Any]:
+        """Statistics of the serialized-response cache, for the health endpoint."""
+        return self._response_cache.stats()
     
+    # Row/column stride for the sampled grid-separability check in
+    # _load_coordinates; reads a few hundred KB instead of the full grid
+    _SEPARABILITY_STRIDE = 64
+
     def _load_coordinates(self):
-        """Load latitude/longitude coordinates from NetCDF file."""
-        if self._lat_center is None or self._lon_center is None:
-            if not self.latlon_file.exists():
-                raise FileNotFoundError(
-                    f"Coordinate file not found: {self.latlon_file}\n"
-                    "Please download llc4320_latlon.nc to the data folder.\n"
-                    "See notebooks/LLC4320_metadata.ipynb for download instructions."
+        """
+        Open the coordinate NetCDF lazily (once per process).
+
+        The full 2-D lat/lon arrays are ~150 MB; most requests only need a
+        small crop, so only the 1-D axes are materialized here. The dataset
+        stays open and the lazy DataArrays pull just the requested window
+        from disk on slicing. The full arrays are read on demand only by
+        the curvilinear bbox fallback (see _full_coords).
+        """
+        if self._coords is not None:
+            return
+
+        coords_key = str(self.latlon_file)
+        with _GLOBAL_LOCK:
+            if coords_key not in _GLOBAL_COORDS:
+                # Prefer the memory-mapped .npy cache written by a previous
+                # run: np.load with mmap_mode is effectively free (no CF
+                # decode, no file read), pages load on demand and the OS
+                # page cache shares them across workers.
+                lat_npy = self.data_dir / "llc4320_lat.npy"
+                lon_npy = self.data_dir / "llc4320_lon.npy"
+                if lat_npy.exists() and lon_npy.exists():
+                    lat_full = np.load(lat_npy, mmap_mode="r")
+                    lon_full = np.load(lon_npy, mmap_mode="r")
+                    lat_1d = np.asarray(lat_full[:, 0])
+                    lon_1d = np.asarray(lon_full[0, :])
+                    stride = self._SEPARABILITY_STRIDE
+                    is_separable = (
+                        np.allclose(lat_full[::stride, ::stride],
+                                    lat_1d[::stride, np.newaxis])
+                        and np.allclose(lon_full[::stride, ::stride],
+                                        lon_1d[np.newaxis, ::stride])
+                        and np.all(np.diff(lat_1d) > 0)
+                        and np.all(np.diff(lon_1d) > 0)
+                    )
+                    _GLOBAL_COORDS[coords_key] = {
+                        "ds": None,
+                        "lat_da": lat_full,
+                        "lon_da": lon_full,
+                        "lat_1d": lat_1d,
+                        "lon_1d": lon_1d,
+                        "separable": is_separable,
+                        "lat_full": lat_full,
+                        "lon_full": lon_full,
+                    }
+                    logger.info("Coordinates memory-mapped from %s and %s", lat_npy, lon_npy)
+                    self._bind_coords(coords_key)
+                    return
+
+                if not self.latlon_file.exists():
+                    raise FileNotFoundError(
+                        f"Coordinate file not found: {self.latlon_file}\n"
+                        "Please download llc4320_latlon.nc to the data folder.\n"
+                        "See notebooks/LLC4320_metadata.ipynb for download instructions."
+                    )
+                logger.info("Loading coordinates from %s...", self.latlon_file)
+                # cache=False keeps xarray from pinning every accessed
+                # value in memory; the dataset stays open for lazy slicing
+                ds = xr.open_dataset(self.latlon_file, cache=False)
+                lat_da = ds["latitude"]
+                lon_da = ds["longitude"]
+
+                # 1-D axes are cheap to materialize (two hyperslab reads)
+                lat_1d = np.asarray(lat_da[:, 0].values)
+                lon_1d = np.asarray(lon_da[0, :].values)
+
+                # If latitude only varies along rows and longitude along
+                # columns (a separable grid, as in LLC4320's latlon
+                # subgrids), the 1-D axes fully describe the grid and bbox
+                # queries can binary-search them. Checked on a strided
+                # sample so the full arrays never have to be read.
+                stride = self._SEPARABILITY_STRIDE
+                lat_sample = np.asarray(lat_da[::stride, ::stride].values)
+                lon_sample = np.asarray(lon_da[::stride, ::stride].values)
+                is_separable = (
+                    np.allclose(lat_sample, lat_1d[::stride, np.newaxis])
+                    and np.allclose(lon_sample, lon_1d[np.newaxis, ::stride])
+                    and np.all(np.diff(lat_1d) > 0)
+                    and np.all(np.diff(lon_1d) > 0)
                 )
-            print(f"Loading coordinates from {self.latlon_file}...")
-            ds = xr.open_dataset(self.latlon_file)
-            print(f"Coordinates loaded from {self.latlon_file} successfully!")
-            self._lat_center = ds["latitude"].values
-            self._lon_center = ds["longitude"].values
-            ds.close()
+                _GLOBAL_COORDS[coords_key] = {
+                    "ds": ds,
+                    "lat_da": lat_da,
+                    "lon_da": lon_da,
+                    "lat_1d": lat_1d,
+                    "lon_1d": lon_1d,
+                    "separable": is_separable,
+                    # full 2-D arrays, materialized lazily by _full_coords
+                    "lat_full": None,
+                    "lon_full": None,
+                }
+                logger.info("Coordinates opened from %s (lazy)", self.latlon_file)
+            self._bind_coords(coords_key)
+
+    def _bind_coords(self, coords_key: str):
+        """Point the per-instance references at the global coordinate entry."""
+        self._coords = _GLOBAL_COORDS[coords_key]
+        self._lat_1d = self._coords["lat_1d"]
+        self._lon_1d = self._coords["lon_1d"]
+        self._is_separable = self._coords["separable"]
+
+    def _full_coords(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Materialize (and cache) the full 2-D lat/lon arrays.
+
+        Only the curvilinear bbox fallback needs these; separable grids
+        never pay the ~150 MB read.
+        """
+        with _GLOBAL_LOCK:
+            if self._coords["lat_full"] is None:
+                lat_full = np.asarray(
+                    self._coords["lat_da"].values, dtype=np.float32
+                )
+                lon_full = np.asarray(
+                    self._coords["lon_da"].values, dtype=np.float32
+                )
+                self._coords["lat_full"] = lat_full
+                self._coords["lon_full"] = lon_full
+                # Persist as .npy so future processes skip the NetCDF
+                # decode entirely and mmap these instead (written via a
+                # temp file so a crash can't leave a truncated cache)
+                for name, arr in (("llc4320_lat.npy", lat_full),
+                                  ("llc4320_lon.npy", lon_full)):
+                    try:
+                        tmp_path = self.data_dir / (name + ".tmp")
+                        with open(tmp_path, "wb") as f:
+                            np.save(f, arr)
+                        os.replace(tmp_path, self.data_dir / name)
+                    except OSError as e:
+                        logger.warning("Could not write coordinate cache %s: %s", name, e)
+            return self._coords["lat_full"], self._coords["lon_full"]
+
+    def _coord_crop(
+        self, y_min: int, y_max: int, x_min: int, x_max: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Materialize just the lat/lon window for a pixel bbox."""
+        if self._coords["lat_full"] is not None:
+            # Already resident (curvilinear fallback ran): slice in memory
+            lat = self._coords["lat_full"][y_min:y_max, x_min:x_max]
+            lon = self._coords["lon_full"][y_min:y_max, x_min:x_max]
+        else:
+            lat = np.asarray(self._coords["lat_da"][y_min:y_max, x_min:x_max].values)
+            lon = np.asarray(self._coords["lon_da"][y_min:y_max, x_min:x_max].values)
+        return lat, lon
     
+    def _dataset_future(self, field: str) -> Future:
+        """
+        Get (or start) the loading future for a field's dataset.
+
+        The handshake runs on its own pool (never the read pool, which
+        may be full of tasks waiting on this very future), so triggering
+        a load never blocks the calling thread; a failed load is dropped
+        from the cache so the next caller retries.
+        """
+        field_lower = field.lower()
+        if field_lower not in _FIELD_KEYS:
+            raise ValueError(
+                f"Unknown field: {field}. Available fields: {list(_AVAILABLE_FIELDS)}"
+            )
+
+        url = FIELD_URLS[field_lower]
+        _, load_pool = self._executors()
+        with _GLOBAL_LOCK:
+            future = _GLOBAL_DS_FUTURES.get(url)
+            if future is None:
+                future = load_pool.submit(self._load_dataset, field, url)
+                _GLOBAL_DS_FUTURES[url] = future
+        return future
+
+    @staticmethod
+    def _load_dataset(field: str, url: str):
+        """Run the ovp.LoadDataset handshake (on the loader pool)."""
+        logger.info("Loading dataset for field '%s' from %s...", field, url)
+        try:
+            dataset = _ovp().LoadDataset(url)
+        except Exception:
+            # Drop the failed future so a later request can retry
+            with _GLOBAL_LOCK:
+                _GLOBAL_DS_FUTURES.pop(url, None)
+            raise
+        logger.info("Dataset for field '%s' loaded successfully", field)
+        return dataset
+
     def _get_dataset(self, field: str):
         """
-        Get or load OpenVisus dataset for a field.
-        
+        Get the OpenVisus dataset for a field, waiting for its load if needed.
+
         Parameters:
         -----------
         field : str
             Field name (salinity, temperature, vertical_velocity, salt, theta, w)
-        
+
         Returns:
         --------
         openvisuspy dataset object
         """
-        # Normalize field name
-        field_lower = field.lower()
-        if field_lower not in FIELD_URLS:
-            raise ValueError(
-                f"Unknown field: {field}. Available fields: {list(FIELD_URLS.keys())}"
-            )
-        
-        # Return cached dataset if available
-        if field_lower in self._datasets:
-            return self._datasets[field_lower]
-        
-        # Load dataset from server
-        url = FIELD_URLS[field_lower]
-        print(f"Loading dataset for field '{field}' from {url}...")
-        dataset = ovp.LoadDataset(url)
-        self._datasets[field_lower] = dataset
-        print("  Dataset loaded successfully!")
-        
-        return dataset
+        return self._dataset_future(field).result()
+
+    def warmup(self, fields=None):
+        """
+        Preload dataset handles (and coordinates) into the process-global cache.
+
+        Runs automatically on a background thread at construction and can
+        also be called synchronously at server startup (e.g. before gunicorn
+        forks workers) so no user request pays the ovp.LoadDataset
+        handshake or the NetCDF coordinate read. A field that fails to load
+        is logged and retried lazily on first use.
+
+        Parameters:
+        -----------
+        fields : iterable of str, optional
+            Field names to warm. Defaults to every field in FIELD_URLS.
+        """
+        if fields is None:
+            fields = FIELD_URLS.keys()
+        # Kick all loads off first so they overlap, then wait
+        futures = {field: self._dataset_future(field) for field in fields}
+        for field, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning("Could not warm field '%s': %s", field, e)
+        try:
+            self._load_coordinates()
+        except FileNotFoundError as e:
+            # The coordinate file is optional at startup; endpoints that
+            # need it will raise the same error with download instructions.
+            logger.warning("%s", e)
     
+    @lru_cache(maxsize=1024)
+    def _bbox_indices(
+        self,
+        lat_min: float,
+        lat_max: float,
+        lon_min: float,
+        lon_max: float
+    ) -> Tuple[int, int, int, int]:
+        """
+        Resolve a lat/lon range to pixel index ranges in the coordinate grid.
+
+        Cached, so repeat queries for the same region (a UI panning around
+        a fixed view) skip the full-grid scan entirely. Coordinates must be
+        loaded before the first call.
+
+        Parameters:
+        -----------
+        lat_min, lat_max : float
+            Latitude range in degrees
+        lon_min, lon_max : float
+            Longitude range in degrees
+
+        Returns:
+        --------
+        (x_min, x_max, y_min, y_max) : tuple of int
+            Half-open pixel index ranges covering the requested region
+        """
+        # Fast path: on a separable grid the bbox follows from binary
+        # search on the cached monotonic 1-D axes - O(log N) instead of
+        # comparing every cell of the 2-D coordinate arrays.
+        if self._is_separable:
+            y_min = int(np.searchsorted(self._lat_1d, lat_min, side="left"))
+            y_max = int(np.searchsorted(self._lat_1d, lat_max, side="right"))
+            x_min = int(np.searchsorted(self._lon_1d, lon_min, side="left"))
+            x_max = int(np.searchsorted(self._lon_1d, lon_max, side="right"))
+
+            if y_min >= y_max or x_min >= x_max:
+                raise ValueError("No data found in the given lat/lon range.")
+
+            return x_min, x_max, y_min, y_max
+
+        # Curvilinear fallback: needs the full 2-D coordinate arrays
+        lat_center, lon_center = self._full_coords()
+
+        # With numba available, a fused parallel scan finds the bbox in
+        # one pass without allocating mask temporaries
+        if _bbox_kernel is not None:
+            y_lo, y_hi, x_lo, x_hi = _bbox_kernel(
+                np.asarray(lat_center), np.asarray(lon_center),
+                float(lat_min), float(lat_max),
+                float(lon_min), float(lon_max)
+            )
+            if y_hi < 0:
+                raise ValueError("No data found in the given lat/lon range.")
+            return int(x_lo), int(x_hi) + 1, int(y_lo), int(y_hi) + 1
+
+        # Mask of cells inside the requested region. Instead of np.where
+        # (which materializes two large index arrays just to take their
+        # min/max), reduce the mask per axis and locate the first/last True
+        # with argmax - O(H+W) index work and no index allocation.
+        hits = (
+            (lat_center >= lat_min)
+            & (lat_center <= lat_max)
+            & (lon_center >= lon_min)
+            & (lon_center <= lon_max)
+        )
+
+        row_any = hits.any(axis=1)
+        col_any = hits.any(axis=0)
+
+        if not row_any.any():
+            raise ValueError("No data found in the given lat/lon range.")
+
+        y_min = int(row_any.argmax())
+        y_max = len(row_any) - int(row_any[::-1].argmax())
+        x_min = int(col_any.argmax())
+        x_max = len(col_any) - int(col_any[::-1].argmax())
+
+        return x_min, x_max, y_min, y_max
+
     def _extract_data_by_latlon_range(
         self,
-        db,
-        lat_center: np.ndarray,
-        lon_center: np.ndarray,
+        field: str,
         lat_range: list,
         lon_range: list,
         z_range: list,
@@ -129,18 +874,17 @@ class DataService:
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Extract data for a specific timestep using latitude/longitude range.
-        
+
+        Read results are cached in a byte-bounded LRU keyed by the full
+        query, so repeated requests for the same region skip OpenVisus.
+
         Parameters:
         -----------
-        db : openvisuspy dataset object
-            Pre-loaded dataset
-        lat_center : np.ndarray
-            Latitude coordinate array
-        lon_center : np.ndarray
-            Longitude coordinate array
-        lat_range : list
+        field : str
+            Field name (salinity, temperature, vertical_velocity, etc.)
+        lat_range : list or tuple
             [min_lat, max_lat] in degrees
-        lon_range : list
+        lon_range : list or tuple
             [min_lon, max_lon] in degrees
         z_range : list
             [min_z, max_z] depth level indices
@@ -148,7 +892,7 @@ class DataService:
             Data quality level
         timestep : int
             Timestep index
-        
+
         Returns:
         --------
         data : np.ndarray
@@ -158,40 +902,92 @@ class DataService:
         lon : np.ndarray
             Longitude coordinates for the region
         """
-        # Create mask for lat/lon range
-        mask = (
-            (lat_center >= lat_range[0])
-            & (lat_center <= lat_range[1])
-            & (lon_center >= lon_range[0])
-            & (lon_center <= lon_range[1])
+        x_min, x_max, y_min, y_max = self._bbox_indices(
+            float(lat_range[0]), float(lat_range[1]),
+            float(lon_range[0]), float(lon_range[1])
         )
-        
-        y_indices, x_indices = np.where(mask)
-        
-        if len(x_indices) == 0 or len(y_indices) == 0:
-            raise ValueError("No data found in the given lat/lon range.")
-        
-        x_min = int(x_indices.min())
-        x_max = int(x_indices.max()) + 1
-        y_min = int(y_indices.min())
-        y_max = int(y_indices.max()) + 1
-        
-        # Extract lat/lon for the region
-        lat = lat_center[y_min:y_max, x_min:x_max]
-        lon = lon_center[y_min:y_max, x_min:x_max]
-        
+
+        # Materialize just the lat/lon window for the region. On separable
+        # grids the two 1-D axis crops fully describe it, so the tiled
+        # H x W arrays are never built (nor serialized)
+        if self._is_separable:
+            lat = self._lat_1d[y_min:y_max]
+            lon = self._lon_1d[x_min:x_max]
+        else:
+            lat, lon = self._coord_crop(y_min, y_max, x_min, x_max)
+
+        # Serve repeat queries from the in-memory cache
+        cache_key = (
+            field.lower(), timestep, x_min, x_max, y_min, y_max,
+            tuple(z_range), quality
+        )
+        data = self._read_cache.get(cache_key)
+        if data is not None:
+            return data, lat, lon
+
+        # Then the persistent disk cache, which survives restarts
+        disk_key = None
+        if self._slice_cache is not None:
+            disk_key = hashlib.blake2b(
+                f"{field.lower()}|{timestep}|{quality}"
+                f"|{x_min}:{x_max}|{y_min}:{y_max}"
+                f"|{z_range[0]}:{z_range[1]}".encode()
+            ).digest()
+            cached = self._slice_cache.get(disk_key)
+            if cached is not None:
+                shape, raw = cached
+                data = np.frombuffer(raw, dtype=np.float32).reshape(shape)
+                self._read_cache.put(cache_key, data)
+                return data, lat, lon
+
+        # Snap the read box outward to IDX block boundaries (clamped to the
+        # coordinate grid), so nearby queries fetch identical blocks and the
+        # OpenVisus cache can serve them; the result is cropped back below.
+        grid_h, grid_w = self._coords["lat_da"].shape
+        xa_min = (x_min // IDX_BLOCK) * IDX_BLOCK
+        xa_max = min(-(-x_max // IDX_BLOCK) * IDX_BLOCK, grid_w)
+        ya_min = (y_min // IDX_BLOCK) * IDX_BLOCK
+        ya_max = min(-(-y_max // IDX_BLOCK) * IDX_BLOCK, grid_h)
+
         # Read data for this timestep
+        db = self._get_dataset(field)
         try:
             data = db.db.read(
                 time=timestep,
-                x=[x_min, x_max],
-                y=[y_min, y_max],
+                x=[xa_min, xa_max],
+                y=[ya_min, ya_max],
                 z=z_range,
                 quality=quality
             )
-            return data, lat, lon
         except Exception as e:
             raise RuntimeError(f"Failed to read data at timestep {timestep}: {e}") from e
+
+        # Crop back to the requested extent. Negative quality returns a
+        # subsampled array, so the crop offsets are scaled by the ratio of
+        # returned size to the aligned box before slicing.
+        sy = data.shape[-2] / (ya_max - ya_min)
+        sx = data.shape[-1] / (xa_max - xa_min)
+        y0 = int(round((y_min - ya_min) * sy))
+        y1 = max(y0 + 1, int(round((y_max - ya_min) * sy)))
+        x0 = int(round((x_min - xa_min) * sx))
+        x1 = max(x0 + 1, int(round((x_max - xa_min) * sx)))
+        # Copy the crop out of the aligned read: caching the view would
+        # keep the whole block-aligned buffer alive while the LRU only
+        # accounts the view's nbytes, blowing the byte budget severalfold
+        # (and orjson rejects non-contiguous arrays downstream)
+        data = np.ascontiguousarray(data[..., y0:y1, x0:x1])
+
+        self._read_cache.put(cache_key, data)
+        if disk_key is not None:
+            try:
+                self._slice_cache.set(
+                    disk_key,
+                    (data.shape,
+                     np.ascontiguousarray(data, dtype=np.float32).tobytes())
+                )
+            except OSError as e:
+                logger.warning("Could not write slice cache entry: %s", e)
+        return data, lat, lon
     
     def get_metadata(self, field: str = "salinity") -> Dict[str, Any]:
         """
@@ -222,17 +1018,217 @@ class DataService:
             },
             "total_timesteps": len(timesteps),
             "data_type": "float32",
-            "available_fields": list(FIELD_URLS.keys()),
-            "field_units": {
-                "salinity": "g kg⁻¹",
-                "salt": "g kg⁻¹",
-                "temperature": "°C",
-                "theta": "°C",
-                "vertical_velocity": "m s⁻¹",
-                "w": "m s⁻¹"
-            }
+            "available_fields": _AVAILABLE_FIELDS,
+            "field_units": _FIELD_UNITS
         }
     
+    def _read_cube(
+        self,
+        field: str,
+        timestep: int,
+        lat_range: tuple,
+        lon_range: tuple,
+        quality: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """
+        Fetch the full-depth cube for a bbox/timestep in one read.
+
+        N depth pulls at the same view then collapse into one network
+        operation plus N local slices. No caching layer of its own: the
+        read inside _extract_data_by_latlon_range already lands in the
+        byte-bounded read cache (and disk cache), so scrubbing back and
+        forth through depths only repeats the cheap squeeze below.
+
+        Returns:
+        --------
+        (cube, lat, lon, z_levels) : 3D cube (z, y, x), the matching
+            coordinate crops, and the dataset's full depth count (the
+            cube's z axis may be shorter when quality subsamples it)
+        """
+        db = self._get_dataset(field)
+        logic_box = db.getLogicBox()
+        z_levels = (
+            int(logic_box[1][2])
+            if len(logic_box) > 1 and len(logic_box[1]) > 2 else 1
+        )
+        data, lat, lon = self._extract_data_by_latlon_range(
+            field, list(lat_range), list(lon_range),
+            [0, z_levels], quality, timestep
+        )
+        if data.ndim == 4 and data.shape[0] == 1:
+            data = np.squeeze(data, axis=0)
+        return data, lat, lon, z_levels
+
+    def _get_slice_array(
+        self,
+        field: str,
+        timestep: int,
+        depth_level: int,
+        lat_range: list,
+        lon_range: list,
+        quality: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fetch a 2D slice and its coordinate crops without serialization.
+
+        Returns:
+        --------
+        (data_slice, lat, lon) : tuple of np.ndarray
+            2D data slice (y, x) and the matching coordinate arrays
+        """
+        self._load_coordinates()
+
+        # Depth scrubbing: once a client asks for a second distinct depth
+        # at the same bbox/timestep, fetch the whole cube in one read and
+        # slice every further depth out of it locally
+        cube_key = (
+            field.lower(), timestep,
+            tuple(lat_range), tuple(lon_range), quality
+        )
+        if (cube_key not in self._depth_history
+                and len(self._depth_history) >= DEPTH_HISTORY_MAX):
+            # Evict the oldest history (dicts keep insertion order)
+            self._depth_history.pop(next(iter(self._depth_history)))
+        seen_depths = self._depth_history.setdefault(cube_key, set())
+        seen_depths.add(depth_level)
+        if len(seen_depths) > 1:
+            cube, lat, lon, z_levels = self._read_cube(
+                field, timestep, tuple(lat_range), tuple(lon_range), quality
+            )
+            # Negative quality subsamples the depth axis along with y/x,
+            # so the full-resolution level index only maps onto the cube
+            # when it came back at full depth; otherwise fall through to
+            # the exact single-level read below
+            if cube.shape[0] == z_levels and 0 <= depth_level < z_levels:
+                return cube[depth_level], lat, lon
+
+        # Extract data for the specified region
+        z_range = [depth_level, depth_level + 1]
+        data, lat, lon = self._extract_data_by_latlon_range(
+            field, lat_range, lon_range, z_range, quality, timestep
+        )
+
+        # Drop leading singleton axes (time/depth) down to the 2D slice.
+        # np.squeeze returns a view, so no copy happens here; conversion to
+        # contiguous float32 is deferred to the serializer, which skips it
+        # when the view already qualifies.
+        lead = tuple(i for i, n in enumerate(data.shape[:-2]) if n == 1)
+        data_slice = np.squeeze(data, axis=lead) if lead else data
+
+        return data_slice, lat, lon
+
+    def _get_timestep_array(
+        self,
+        field: str,
+        timestep: int,
+        lat_range: list,
+        lon_range: list,
+        z_range: list,
+        quality: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fetch a 3D timestep block and its coordinate crops without serialization.
+
+        Returns:
+        --------
+        (timestep_data, lat, lon) : tuple of np.ndarray
+            3D data block (z, y, x) and the matching coordinate arrays
+        """
+        self._load_coordinates()
+
+        # Extract data for the specified region
+        data, lat, lon = self._extract_data_by_latlon_range(
+            field, lat_range, lon_range, z_range, quality, timestep
+        )
+
+        # Remove the singleton time dimension if present (zero-copy view)
+        if data.ndim == 4 and data.shape[0] == 1:
+            timestep_data = np.squeeze(data, axis=0)
+        else:
+            timestep_data = data
+
+        return timestep_data, lat, lon
+
+    def get_data_slice_binary(
+        self,
+        field: str,
+        timestep: int,
+        depth_level: int,
+        lat_range: list,
+        lon_range: list,
+        quality: int = -12
+    ) -> Tuple[bytes, Tuple[int, ...]]:
+        """
+        Get a 2D slice as raw little-endian float32 bytes.
+
+        Intended for the binary response format: the frontend wraps the
+        body in a Float32Array directly, with no JSON or base64 decode.
+
+        Returns:
+        --------
+        (payload, shape) : raw bytes and the slice shape
+        """
+        data_slice, _, _ = self._get_slice_array(
+            field, timestep, depth_level, lat_range, lon_range, quality
+        )
+        arr = np.ascontiguousarray(data_slice, dtype="<f4")
+        return arr.tobytes(), arr.shape
+
+    def get_data_slice_packed(
+        self,
+        field: str,
+        timestep: int,
+        depth_level: int,
+        lat_range: list,
+        lon_range: list,
+        quality: int = -12
+    ) -> bytes:
+        """
+        Get a 2D slice plus its coordinates as one packed binary payload.
+
+        Unlike get_data_slice_binary (data only, shape in HTTP headers),
+        this self-describing layout carries the data, latitude and
+        longitude float32 blocks behind a small struct header, so a single
+        request serves everything the frontend needs with zero JSON work.
+        See _pack_blocks for the layout.
+
+        Returns:
+        --------
+        bytes : packed header + data/lat/lon float32 blocks
+        """
+        data_slice, lat, lon = self._get_slice_array(
+            field, timestep, depth_level, lat_range, lon_range, quality
+        )
+        # The packed layout always carries 2-D coordinate blocks; expand
+        # the 1-D axis crops from separable grids by broadcasting
+        if lat.ndim == 1:
+            grid_shape = (lat.size, lon.size)
+            lat = np.broadcast_to(lat[:, np.newaxis], grid_shape)
+            lon = np.broadcast_to(lon[np.newaxis, :], grid_shape)
+        return _pack_blocks(data_slice, lat, lon)
+
+    def get_timestep_data_binary(
+        self,
+        field: str,
+        timestep: int,
+        lat_range: list,
+        lon_range: list,
+        z_range: list = [0, 1],
+        quality: int = -12
+    ) -> Tuple[bytes, Tuple[int, ...]]:
+        """
+        Get a 3D timestep block as raw little-endian float32 bytes.
+
+        Returns:
+        --------
+        (payload, shape) : raw bytes and the block shape
+        """
+        timestep_data, _, _ = self._get_timestep_array(
+            field, timestep, lat_range, lon_range, z_range, quality
+        )
+        arr = np.ascontiguousarray(timestep_data, dtype="<f4")
+        return arr.tobytes(), arr.shape
+
     def get_data_slice(
         self,
         field: str,
@@ -241,8 +1237,8 @@ class DataService:
         lat_range: list,
         lon_range: list,
         quality: int = -12,
-        format_type: str = "array"
-    ) -> Dict[str, Any]:
+        format_type: str = "base64"
+    ) -> "SliceResponse":
         """
         Get a 2D slice of data for a specific timestep and depth level.
         
@@ -261,62 +1257,65 @@ class DataService:
         quality : int
             Data quality level (default: -12 for faster loading)
         format_type : str
-            Response format: 'array' (nested lists) or 'base64' (base64-encoded)
+            Response format: 'base64' (default, base64-encoded float32 for
+            data and coordinates), 'base64_blosc' (Blosc-zstd compressed
+            data before base64), 'base64_fp16' (half-precision data for
+            half the payload) or 'array' (legacy nested lists)
         
         Returns:
         --------
-        dict : Dictionary with data array and coordinates
+        SliceResponse : data array and coordinates
         """
-        self._load_coordinates()
-        db = self._get_dataset(field)
-        
-        # Extract data for the specified region
-        z_range = [depth_level, depth_level + 1]
-        data, lat, lon = self._extract_data_by_latlon_range(
-            db, self._lat_center, self._lon_center,
-            lat_range, lon_range, z_range, quality, timestep
+        # Normalize legacy spellings first so aliases share a cache entry
+        format_type = _canonical_format(format_type)
+
+        # Identical queries return the previously serialized response
+        response_key = (
+            field.lower(), timestep, depth_level, quality,
+            tuple(lat_range), tuple(lon_range), format_type
         )
-        
-        # Extract 2D slice (remove depth dimension if it's 1)
-        if len(data.shape) == 4:
-            data_slice = data[0, 0, :, :]  # (time, z, y, x) -> (y, x)
-        elif len(data.shape) == 3:
-            data_slice = data[0, :, :]  # (z, y, x) -> (y, x)
-        else:
-            data_slice = data
-        
-        # Serialize data based on format
-        if format_type == "base64":
-            # Convert to base64 for more efficient transfer
-            data_bytes = data_slice.astype(np.float32).tobytes()
-            data_b64 = base64.b64encode(data_bytes).decode('utf-8')
-            data_serialized = {
-                "format": "base64",
-                "dtype": "float32",
-                "shape": list(data_slice.shape),
-                "data": data_b64
-            }
-        else:
-            # Convert to nested lists (JSON-serializable)
+        cached = self._response_cache.get(response_key)
+        if cached is not None:
+            return cached
+
+        data_slice, lat, lon = self._get_slice_array(
+            field, timestep, depth_level, lat_range, lon_range, quality
+        )
+
+        # Serialize data based on format; base64 is the default since the
+        # legacy array format builds a Python object per element
+        if format_type == "array":
+            # Legacy: ndarray passes straight through to the orjson
+            # provider, which serializes it natively without a .tolist()
+            # copy but refuses non-contiguous views like this crop
             data_serialized = {
                 "format": "array",
-                "data": data_slice.tolist()
+                "data": np.ascontiguousarray(data_slice)
             }
+            coordinates = _coordinates_payload(lat, lon, serialize=False)
+        else:
+            # 'base64_blosc' compresses the data block; coordinate crops
+            # are small, so they stay plain base64 for simpler decoding
+            data_serialized = _serialize_b64(
+                data_slice,
+                compress=(format_type == "base64_blosc"),
+                dtype=np.float16 if format_type == "base64_fp16" else np.float32,
+            )
+            coordinates = _coordinates_payload(lat, lon, serialize=True)
         
-        return {
-            "field": field,
-            "timestep": timestep,
-            "depth_level": depth_level,
-            "data": data_serialized,
-            "coordinates": {
-                "latitude": lat.tolist(),
-                "longitude": lon.tolist()
-            },
-            "shape": list(data_slice.shape),
-            "lat_range": lat_range,
-            "lon_range": lon_range,
-            "quality": quality
-        }
+        result = SliceResponse(
+            field=field,
+            timestep=timestep,
+            depth_level=depth_level,
+            data=data_serialized,
+            coordinates=coordinates,
+            shape=list(data_slice.shape),
+            lat_range=lat_range,
+            lon_range=lon_range,
+            quality=quality
+        )
+        self._response_cache.put(response_key, result)
+        return result
     
     def get_timestep_data(
         self,
@@ -326,8 +1325,8 @@ class DataService:
         lon_range: list,
         z_range: list = [0, 1],
         quality: int = -12,
-        format_type: str = "array"
-    ) -> Dict[str, Any]:
+        format_type: str = "base64"
+    ) -> "TimestepResponse":
         """
         Get data for a specific timestep across multiple depth levels (3D data: depth, y, x).
         
@@ -346,55 +1345,153 @@ class DataService:
         quality : int
             Data quality level (default: -12 for faster loading)
         format_type : str
-            Response format: 'array' or 'base64'
+            Response format: 'base64' (default), 'base64_blosc', 'base64_fp16' or 'array' (legacy)
         
         Returns:
         --------
-        dict : Dictionary with 3D data array and coordinates
+        TimestepResponse : 3D data array and coordinates
         """
-        self._load_coordinates()
-        db = self._get_dataset(field)
-        
-        # Extract data for the specified region
-        data, lat, lon = self._extract_data_by_latlon_range(
-            db, self._lat_center, self._lon_center,
-            lat_range, lon_range, z_range, quality, timestep
+        # Normalize legacy spellings first so aliases share a cache entry
+        format_type = _canonical_format(format_type)
+
+        # Identical queries return the previously serialized response
+        response_key = (
+            field.lower(), timestep, tuple(z_range), quality,
+            tuple(lat_range), tuple(lon_range), format_type
         )
-        
-        # Remove time dimension if present (should be single timestep)
-        if len(data.shape) == 4:
-            timestep_data = data[0, :, :, :]  # (time, z, y, x) -> (z, y, x)
-        else:
-            timestep_data = data
-        
-        # Serialize data
-        if format_type == "base64":
-            data_bytes = timestep_data.astype(np.float32).tobytes()
-            data_b64 = base64.b64encode(data_bytes).decode('utf-8')
+        cached = self._response_cache.get(response_key)
+        if cached is not None:
+            return cached
+
+        timestep_data, lat, lon = self._get_timestep_array(
+            field, timestep, lat_range, lon_range, z_range, quality
+        )
+
+        # Serialize data; base64 is the default, see get_data_slice
+        if format_type == "array":
             data_serialized = {
-                "format": "base64",
-                "dtype": "float32",
-                "shape": list(timestep_data.shape),
-                "data": data_b64
+                "format": "array",
+                "data": np.ascontiguousarray(timestep_data)
             }
+            coordinates = _coordinates_payload(lat, lon, serialize=False)
         else:
+            # 'base64_blosc' compresses the data block; coordinate crops
+            # are small, so they stay plain base64 for simpler decoding
+            data_serialized = _serialize_b64(
+                timestep_data,
+                compress=(format_type == "base64_blosc"),
+                dtype=np.float16 if format_type == "base64_fp16" else np.float32,
+            )
+            coordinates = _coordinates_payload(lat, lon, serialize=True)
+        
+        result = TimestepResponse(
+            field=field,
+            timestep=timestep,
+            data=data_serialized,
+            coordinates=coordinates,
+            shape=list(timestep_data.shape),
+            lat_range=lat_range,
+            lon_range=lon_range,
+            z_range=z_range,
+            quality=quality
+        )
+        self._response_cache.put(response_key, result)
+        return result
+
+    def get_timesteps_data(
+        self,
+        field: str,
+        timesteps: list,
+        lat_range: list,
+        lon_range: list,
+        z_range: list = [0, 1],
+        quality: int = -12,
+        format_type: str = "base64"
+    ) -> "TimestepsResponse":
+        """
+        Get data for multiple timesteps concurrently (4D data: time, depth, y, x).
+
+        Each timestep is a separate HTTP-bound OpenVisus read, so the reads
+        are fanned out across the shared thread pool and collected in
+        timestep order - N reads cost roughly N/8 round trips instead of N.
+
+        Parameters:
+        -----------
+        field : str
+            Field name (salinity, temperature, vertical_velocity, etc.)
+        timesteps : list of int
+            Timestep indices to fetch
+        lat_range : list
+            [min_lat, max_lat] in degrees
+        lon_range : list
+            [min_lon, max_lon] in degrees
+        z_range : list
+            [min_z, max_z] depth level indices (default: [0, 1] for surface only)
+        quality : int
+            Data quality level (default: -12 for faster loading)
+        format_type : str
+            Response format: 'base64' (default), 'base64_blosc', 'base64_fp16' or 'array' (legacy)
+
+        Returns:
+        --------
+        TimestepsResponse : 4D data array (time, depth, y, x) and coordinates
+        """
+        if not timesteps:
+            raise ValueError("timesteps must be a non-empty list of indices")
+
+        format_type = _canonical_format(format_type)
+        self._load_coordinates()
+
+        # Fan the per-timestep reads out over the shared pool. The bbox is
+        # resolved once (lru_cache on _bbox_indices) and repeat queries hit
+        # the read cache inside _extract_data_by_latlon_range.
+        io_pool, _ = self._executors()
+        futures = {
+            io_pool.submit(
+                self._extract_data_by_latlon_range,
+                field, lat_range, lon_range, z_range, quality, t
+            ): i
+            for i, t in enumerate(timesteps)
+        }
+
+        # The returned shape depends on quality (negative values subsample),
+        # so the output block is allocated from the first completed read.
+        block = None
+        lat = lon = None
+        for future in as_completed(futures):
+            i = futures[future]
+            data, lat, lon = future.result()
+            if data.ndim == 4:
+                data = data[0]  # (time, z, y, x) -> (z, y, x)
+            if block is None:
+                block = np.empty((len(timesteps),) + data.shape, dtype=np.float32)
+            block[i] = data
+
+        if format_type == "array":
             data_serialized = {
                 "format": "array",
-                "data": timestep_data.tolist()
+                "data": np.ascontiguousarray(block)
             }
-        
-        return {
-            "field": field,
-            "timestep": timestep,
-            "data": data_serialized,
-            "coordinates": {
-                "latitude": lat.tolist(),
-                "longitude": lon.tolist()
-            },
-            "shape": list(timestep_data.shape),
-            "lat_range": lat_range,
-            "lon_range": lon_range,
-            "z_range": z_range,
-            "quality": quality
-        }
-    
+            coordinates = _coordinates_payload(lat, lon, serialize=False)
+        else:
+            # 'base64_blosc' compresses the data block; coordinate crops
+            # are small, so they stay plain base64 for simpler decoding
+            data_serialized = _serialize_b64(
+                block,
+                compress=(format_type == "base64_blosc"),
+                dtype=np.float16 if format_type == "base64_fp16" else np.float32,
+            )
+            coordinates = _coordinates_payload(lat, lon, serialize=True)
+
+        return TimestepsResponse(
+            field=field,
+            timesteps=list(timesteps),
+            data=data_serialized,
+            coordinates=coordinates,
+            shape=list(block.shape),
+            lat_range=lat_range,
+            lon_range=lon_range,
+            z_range=z_range,
+            quality=quality
+        )
+
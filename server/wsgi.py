@@ -0,0 +1,15 @@
+"""
+WSGI entry point for running the LLC4320 API under a production server.
+
+The development server started by `python -m server.app` is single-threaded,
+so concurrent requests serialize behind each OpenVisus round trip. Run this
+module under gunicorn instead; the OpenVisus reads release the GIL, so a
+threaded worker class overlaps many in-flight requests per process:
+
+    gunicorn --workers 4 --threads 16 --worker-class gthread \
+        --timeout 120 --keep-alive 30 server.wsgi:application
+"""
+
+from server.app import app
+
+application = app